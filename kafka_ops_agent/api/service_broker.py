@@ -1,7 +1,8 @@
 """Open Service Broker API implementation."""
 
 import logging
-from typing import Dict, Any, Optional
+import time
+from typing import Dict, Any, Optional, Tuple
 from flask import Flask, request, jsonify, g
 from functools import wraps
 import asyncio
@@ -29,6 +30,10 @@ logger = logging.getLogger(__name__)
 _provisioning_service: Optional[ProvisioningService] = None
 _executor = ThreadPoolExecutor(max_workers=4)
 
+# Long-poll support for last_operation (?wait=<seconds>), capped by
+# config.api.long_poll_max_wait since a held request blocks its worker thread
+LONG_POLL_INTERVAL = 1.0
+
 
 def get_provisioning_service() -> ProvisioningService:
     """Get or create provisioning service instance."""
@@ -68,6 +73,18 @@ def require_auth(f):
     return authenticated(f)
 
 
+def map_operation_state(status) -> Tuple[str, str]:
+    """Map a cluster status to an OSB last_operation state and description."""
+    if status.value == "running":
+        return "succeeded", "Service instance is running"
+    elif status.value in ["creating", "stopping"]:
+        return "in progress", f"Service instance is {status.value}"
+    elif status.value == "error":
+        return "failed", "Service instance failed"
+    else:
+        return "in progress", f"Service instance status: {status.value}"
+
+
 def validate_service_id(service_id: str) -> bool:
     """Validate service ID."""
     return service_id == "kafka-service"
@@ -299,11 +316,20 @@ def create_app() -> Flask:
             service_id = request.args.get('service_id')
             plan_id = request.args.get('plan_id')
             operation = request.args.get('operation')
+            wait = min(max(request.args.get('wait', 0.0, type=float), 0.0), config.api.long_poll_max_wait)
             
             # Get cluster status
             provisioning_service = get_provisioning_service()
             status = await provisioning_service.get_cluster_status(instance_id)
             
+            # Long-poll: hold the request while the operation is in progress
+            deadline = time.monotonic() + wait
+            while (status is not None
+                   and map_operation_state(status)[0] == "in progress"
+                   and time.monotonic() < deadline):
+                await asyncio.sleep(min(LONG_POLL_INTERVAL, max(deadline - time.monotonic(), 0.0)))
+                status = await provisioning_service.get_cluster_status(instance_id)
+            
             if status is None:
                 return jsonify(ErrorResponse(
                     error="Gone",
@@ -311,18 +337,7 @@ def create_app() -> Flask:
                 ).dict()), 410
             
             # Map cluster status to operation state
-            if status.value == "running":
-                state = "succeeded"
-                description = "Service instance is running"
-            elif status.value in ["creating", "stopping"]:
-                state = "in progress"
-                description = f"Service instance is {status.value}"
-            elif status.value == "error":
-                state = "failed"
-                description = "Service instance failed"
-            else:
-                state = "in progress"
-                description = f"Service instance status: {status.value}"
+            state, description = map_operation_state(status)
             
             response = LastOperationResponse(
                 state=state,
@@ -36,6 +36,9 @@ class APIConfig:
     debug: bool = False
     api_key: Optional[str] = None
     enable_cors: bool = True
+    # Longest last_operation long-poll (?wait=) in seconds; 0 disables it.
+    # Each held request occupies a worker thread for the whole wait.
+    long_poll_max_wait: float = 5.0
 
 
 @dataclass
@@ -85,6 +88,9 @@ class Config:
         config.api.port = int(os.getenv('API_PORT', str(config.api.port)))
         config.api.debug = os.getenv('API_DEBUG', 'false').lower() == 'true'
         config.api.api_key = os.getenv('API_KEY')
+        config.api.long_poll_max_wait = float(
+            os.getenv('API_LONG_POLL_MAX_WAIT', str(config.api.long_poll_max_wait))
+        )
         
         # Logging config
         config.logging.level = os.getenv('LOG_LEVEL', config.logging.level)
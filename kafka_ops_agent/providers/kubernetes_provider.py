@@ -6,7 +6,7 @@ import yaml
 import tempfile
 from typing import Dict, Any, Optional, List
 from pathlib import Path
-from kubernetes import client, config
+from kubernetes import client, config, watch
 from kubernetes.client.rest import ApiException
 
 from kafka_ops_agent.providers.base import (
@@ -19,34 +19,41 @@ from kafka_ops_agent.models.cluster import ClusterConfig, ConnectionInfo
 
 logger = logging.getLogger(__name__)
 
+# Container images for the cluster components
+ZOOKEEPER_IMAGE = "confluentinc/cp-zookeeper:7.4.0"
+KAFKA_IMAGE = "confluentinc/cp-kafka:7.4.0"
+
 
 class KubernetesProvider(RuntimeProvider):
     """Kubernetes-based Kafka cluster provider."""
     
-    def __init__(self, namespace: str = "kafka-clusters", kubeconfig_path: Optional[str] = None):
+    def __init__(self, namespace: str = "kafka-clusters", kubeconfig_path: Optional[str] = None,
+                 api_client: Optional[client.ApiClient] = None):
         """Initialize Kubernetes provider.
         
         Args:
             namespace: Kubernetes namespace for Kafka clusters
             kubeconfig_path: Path to kubeconfig file (None for in-cluster config)
+            api_client: Preconfigured ApiClient to share (skips loading configuration)
         """
         self.namespace = namespace
         self.kubeconfig_path = kubeconfig_path
         
         try:
-            # Load Kubernetes configuration
-            if kubeconfig_path:
-                config.load_kube_config(config_file=kubeconfig_path)
-            else:
-                try:
-                    config.load_incluster_config()
-                except config.ConfigException:
-                    config.load_kube_config()
+            # Load Kubernetes configuration, unless a configured client is given
+            if api_client is None:
+                if kubeconfig_path:
+                    config.load_kube_config(config_file=kubeconfig_path)
+                else:
+                    try:
+                        config.load_incluster_config()
+                    except config.ConfigException:
+                        config.load_kube_config()
             
             # Initialize Kubernetes clients
-            self.apps_v1 = client.AppsV1Api()
-            self.core_v1 = client.CoreV1Api()
-            self.storage_v1 = client.StorageV1Api()
+            self.apps_v1 = client.AppsV1Api(api_client)
+            self.core_v1 = client.CoreV1Api(api_client)
+            self.storage_v1 = client.StorageV1Api(api_client)
             
             # Ensure namespace exists
             self._ensure_namespace()
@@ -322,7 +329,7 @@ class KubernetesProvider(RuntimeProvider):
                         "containers": [
                             {
                                 "name": "zookeeper",
-                                "image": "confluentinc/cp-zookeeper:7.4.0",
+                                "image": ZOOKEEPER_IMAGE,
                                 "ports": [
                                     {"containerPort": 2181, "name": "client"},
                                     {"containerPort": 2888, "name": "follower"},
@@ -366,7 +373,11 @@ class KubernetesProvider(RuntimeProvider):
                 "volumeClaimTemplates": [
                     {
                         "metadata": {
-                            "name": "zk-data"
+                            "name": "zk-data",
+                            "labels": {
+                                "app": "zookeeper",
+                                "cluster": instance_id
+                            }
                         },
                         "spec": {
                             "accessModes": ["ReadWriteOnce"],
@@ -464,7 +475,7 @@ class KubernetesProvider(RuntimeProvider):
                         "containers": [
                             {
                                 "name": "kafka",
-                                "image": "confluentinc/cp-kafka:7.4.0",
+                                "image": KAFKA_IMAGE,
                                 "ports": [
                                     {"containerPort": 9092, "name": "kafka"}
                                 ],
@@ -498,15 +509,22 @@ class KubernetesProvider(RuntimeProvider):
                                         "cpu": "1000m"
                                     }
                                 },
+                                # Allow up to 2 minutes for the broker to start listening;
+                                # readiness and liveness only begin once this succeeds
+                                "startupProbe": {
+                                    "tcpSocket": {"port": 9092},
+                                    "periodSeconds": 2,
+                                    "failureThreshold": 60
+                                },
                                 "readinessProbe": {
                                     "tcpSocket": {"port": 9092},
-                                    "initialDelaySeconds": 30,
-                                    "periodSeconds": 10
+                                    "initialDelaySeconds": 0,
+                                    "periodSeconds": 5
                                 },
                                 "livenessProbe": {
                                     "tcpSocket": {"port": 9092},
-                                    "initialDelaySeconds": 60,
-                                    "periodSeconds": 15
+                                    "initialDelaySeconds": 0,
+                                    "periodSeconds": 5
                                 }
                             }
                         ]
@@ -515,7 +533,11 @@ class KubernetesProvider(RuntimeProvider):
                 "volumeClaimTemplates": [
                     {
                         "metadata": {
-                            "name": "kafka-data"
+                            "name": "kafka-data",
+                            "labels": {
+                                "app": "kafka",
+                                "cluster": instance_id
+                            }
                         },
                         "spec": {
                             "accessModes": ["ReadWriteOnce"],
@@ -573,20 +595,36 @@ class KubernetesProvider(RuntimeProvider):
         start_time = time.time()
         
         while time.time() - start_time < timeout:
+            remaining = timeout - (time.time() - start_time)
             try:
                 if self.get_cluster_status(instance_id) == ProvisioningStatus.SUCCEEDED:
                     connection_info_dict = self.get_connection_info(instance_id)
                     if connection_info_dict:
                         return ConnectionInfo(**connection_info_dict)
                 
-                time.sleep(15)  # Wait 15 seconds before checking again
+                # Check again as soon as a StatefulSet changes, at most 15 seconds later
+                self._wait_for_statefulset_change(instance_id, max(1, int(min(15, remaining))))
                 
             except Exception as e:
                 logger.warning(f"Error while waiting for Kubernetes cluster {instance_id}: {e}")
-                time.sleep(15)
+                time.sleep(min(15, remaining))
         
         raise Exception(f"Kubernetes cluster {instance_id} did not become ready within {timeout} seconds")
     
+    def _wait_for_statefulset_change(self, instance_id: str, timeout: int):
+        """Block until one of the cluster's StatefulSets changes, or the timeout expires."""
+        w = watch.Watch()
+        for event in w.stream(
+            self.apps_v1.list_namespaced_stateful_set,
+            namespace=self.namespace,
+            label_selector=f"cluster={instance_id}",
+            timeout_seconds=timeout
+        ):
+            # The stream opens with an ADDED event for each existing StatefulSet
+            if event["type"] != "ADDED":
+                w.stop()
+                return
+    
     def _get_cluster_statefulsets(self, instance_id: str) -> List:
         """Get all StatefulSets for a cluster."""
         try:
@@ -637,6 +675,10 @@ class KubernetesProvider(RuntimeProvider):
     
     def _cleanup_cluster(self, instance_id: str):
         """Clean up all Kubernetes resources for a cluster."""
+        # Return once each delete is accepted; the garbage collector removes
+        # dependents (pods, endpoints) in the background
+        delete_options = client.V1DeleteOptions(propagation_policy="Background")
+        
         try:
             # Delete StatefulSets
             statefulsets = self._get_cluster_statefulsets(instance_id)
@@ -644,7 +686,8 @@ class KubernetesProvider(RuntimeProvider):
                 try:
                     self.apps_v1.delete_namespaced_stateful_set(
                         name=sts.metadata.name,
-                        namespace=self.namespace
+                        namespace=self.namespace,
+                        body=delete_options
                     )
                     logger.info(f"Deleted StatefulSet: {sts.metadata.name}")
                 except ApiException as e:
@@ -657,7 +700,8 @@ class KubernetesProvider(RuntimeProvider):
                 try:
                     self.core_v1.delete_namespaced_service(
                         name=svc.metadata.name,
-                        namespace=self.namespace
+                        namespace=self.namespace,
+                        body=delete_options
                     )
                     logger.info(f"Deleted Service: {svc.metadata.name}")
                 except ApiException as e:
@@ -674,7 +718,8 @@ class KubernetesProvider(RuntimeProvider):
                     try:
                         self.core_v1.delete_namespaced_persistent_volume_claim(
                             name=pvc.metadata.name,
-                            namespace=self.namespace
+                            namespace=self.namespace,
+                            body=delete_options
                         )
                         logger.info(f"Deleted PVC: {pvc.metadata.name}")
                     except ApiException as e:
@@ -218,17 +218,24 @@ class TerraformProvider(RuntimeProvider):
         
         return instance_dir if instance_dir.exists() else None
     
-    def _generate_terraform_config(self, instance_id: str, config: ClusterConfig, instance_dir: Path):
-        """Generate Terraform configuration files."""
-        # Generate main configuration
-        main_tf = self._generate_main_tf(instance_id, config)
+    def _generate_terraform_config(self, instance_id: str, config: ClusterConfig,
+                                   instance_dir: Path) -> Dict[str, str]:
+        """Generate Terraform configuration files.
         
-        # Generate variables
-        variables_tf = self._generate_variables_tf()
+        Returns:
+            Mapping of file name to the rendered content that was written
+        """
+        files = self._render_terraform_files(instance_id, config)
         
-        # Generate outputs
-        outputs_tf = self._generate_outputs_tf()
+        # Write files
+        for file_name, content in files.items():
+            (instance_dir / file_name).write_bytes(content.encode())
         
+        logger.info(f"Generated Terraform configuration in {instance_dir}")
+        return files
+    
+    def _render_terraform_files(self, instance_id: str, config: ClusterConfig) -> Dict[str, str]:
+        """Render Terraform configuration file contents without touching disk."""
         # Generate provider-specific configuration
         if self.cloud_provider == "aws":
             provider_tf = self._generate_aws_provider_tf()
@@ -242,18 +249,14 @@ class TerraformProvider(RuntimeProvider):
         else:
             raise ValueError(f"Unsupported cloud provider: {self.cloud_provider}")
         
-        # Write files
-        (instance_dir / "main.tf").write_text(main_tf)
-        (instance_dir / "variables.tf").write_text(variables_tf)
-        (instance_dir / "outputs.tf").write_text(outputs_tf)
-        (instance_dir / "provider.tf").write_text(provider_tf)
-        (instance_dir / "resources.tf").write_text(resources_tf)
-        
-        # Generate terraform.tfvars
-        tfvars = self._generate_tfvars(instance_id, config)
-        (instance_dir / "terraform.tfvars").write_text(tfvars)
-        
-        logger.info(f"Generated Terraform configuration in {instance_dir}")
+        return {
+            "main.tf": self._generate_main_tf(instance_id, config),
+            "variables.tf": self._generate_variables_tf(),
+            "outputs.tf": self._generate_outputs_tf(),
+            "provider.tf": provider_tf,
+            "resources.tf": resources_tf,
+            "terraform.tfvars": self._generate_tfvars(instance_id, config),
+        }
     
     def _generate_main_tf(self, instance_id: str, config: ClusterConfig) -> str:
         """Generate main Terraform configuration."""
@@ -251,7 +251,9 @@ class IntegrationTestRunner:
             ]
         
         if self.args.parallel:
-            pytest_args.extend(["-n", str(self.args.parallel)])
+            # Keep each test class on one worker so class-scoped fixtures
+            # (e.g. a provisioned instance) are set up only once
+            pytest_args.extend(["-n", str(self.args.parallel), "--dist", "loadscope"])
         
         if self.args.verbose:
             pytest_args.append("-s")
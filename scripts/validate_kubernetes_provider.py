@@ -7,6 +7,18 @@ from pathlib import Path
 # Add project root to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+# Manifests expected for the "test-cluster" instance
+EXPECTED_MANIFESTS = frozenset({
+    "test-cluster-zookeeper-service",
+    "test-cluster-zookeeper-statefulset",
+    "test-cluster-kafka-service",
+    "test-cluster-kafka-statefulset",
+})
+
+# Kafka container env vars checked against the parsed cluster config
+_WANTED_ENV = ("KAFKA_LOG_RETENTION_HOURS", "KAFKA_NUM_PARTITIONS", "KAFKA_LOG_SEGMENT_BYTES")
+_WANTED_ENV_SET = frozenset(_WANTED_ENV)
+
 
 def validate_kubernetes_provider():
     """Validate Kubernetes provider implementation."""
@@ -94,15 +106,8 @@ def validate_kubernetes_provider():
         print(f"   ✅ Generated {len(manifests)} manifests")
         
         # Validate manifest structure
-        expected_manifests = [
-            "test-cluster-zookeeper-service",
-            "test-cluster-zookeeper-statefulset", 
-            "test-cluster-kafka-service",
-            "test-cluster-kafka-statefulset"
-        ]
-        
-        for expected in expected_manifests:
-            assert expected in manifests, f"Expected manifest {expected} not found"
+        missing_manifests = EXPECTED_MANIFESTS - manifests.keys()
+        assert not missing_manifests, f"Expected manifests not found: {sorted(missing_manifests)}"
         print("   ✅ All expected manifests generated")
         
         # Validate manifest content
@@ -129,7 +134,11 @@ def validate_kubernetes_provider():
         
         # Check environment variables
         container = kafka_sts["spec"]["template"]["spec"]["containers"][0]
-        env_vars = {env["name"]: env.get("value") for env in container["env"] if "value" in env}
+        env_vars = {
+            env["name"]: env["value"]
+            for env in container["env"]
+            if env["name"] in _WANTED_ENV_SET and "value" in env
+        }
         
         assert env_vars.get("KAFKA_LOG_RETENTION_HOURS") == "168"
         assert env_vars.get("KAFKA_NUM_PARTITIONS") == "6"
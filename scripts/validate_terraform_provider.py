@@ -1,8 +1,10 @@
 #!/usr/bin/env python3
 """Validation script for Terraform provider (no external dependencies)."""
 
+import os
 import sys
 import tempfile
+import types
 import importlib.util
 from pathlib import Path
 
@@ -11,6 +13,50 @@ project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
 
+class MockResult:
+    """Minimal stand-in for ``subprocess.CompletedProcess``."""
+
+    def __init__(self, returncode=0, stdout="", stderr=""):
+        self.returncode = returncode
+        self.stdout = stdout
+        self.stderr = stderr
+
+
+# Shared results handed out by mock_run; callers only read them
+_OK_VERSION = MockResult(0, "Terraform v1.5.0", "")
+_OK = MockResult(0, "Success", "")
+
+# Names of modules whose mocks are already installed in sys.modules
+_MOCKED = set()
+
+
+def mock_run(*args, **kwargs):
+    """Mock ``subprocess.run`` that reports a working terraform binary."""
+    cmd = args[0] if args else kwargs.get("args")
+    if isinstance(cmd, (list, tuple)) and any(arg == "version" for arg in cmd):
+        return _OK_VERSION
+    return _OK
+
+
+def install_mocks():
+    """Install subprocess/shutil mocks into sys.modules exactly once."""
+    if 'subprocess' not in _MOCKED:
+        import subprocess
+        mock_subprocess = types.ModuleType('subprocess')
+        mock_subprocess.__dict__.update(vars(subprocess))
+        mock_subprocess.run = mock_run
+        sys.modules['subprocess'] = mock_subprocess
+        _MOCKED.add('subprocess')
+
+    if 'shutil' not in _MOCKED:
+        import shutil
+        mock_shutil = types.ModuleType('shutil')
+        mock_shutil.__dict__.update(vars(shutil))
+        mock_shutil.rmtree = lambda path, *args, **kwargs: None
+        sys.modules['shutil'] = mock_shutil
+        _MOCKED.add('shutil')
+
+
 def load_module_from_file(module_name, file_path):
     """Load a module directly from file path."""
     spec = importlib.util.spec_from_file_location(module_name, file_path)
@@ -45,30 +91,8 @@ def validate_terraform_provider():
         ConnectionInfo = cluster_module.ConnectionInfo
         print("   ✅ Model classes loaded")
         
-        # Mock subprocess for validation
-        import types
-        mock_subprocess = types.ModuleType('subprocess')
-        
-        # Create mock subprocess.run function
-        class MockResult:
-            def __init__(self, returncode=0, stdout="", stderr=""):
-                self.returncode = returncode
-                self.stdout = stdout
-                self.stderr = stderr
-        
-        def mock_run(*args, **kwargs):
-            # Mock successful terraform version check
-            if "version" in str(args):
-                return MockResult(0, "Terraform v1.5.0", "")
-            return MockResult(0, "Success", "")
-        
-        mock_subprocess.run = mock_run
-        sys.modules['subprocess'] = mock_subprocess
-        
-        # Mock shutil
-        mock_shutil = types.ModuleType('shutil')
-        mock_shutil.rmtree = lambda path: None
-        sys.modules['shutil'] = mock_shutil
+        # Mock subprocess and shutil for validation
+        install_mocks()
         
         # Now load the Terraform provider
         terraform_path = project_root / "kafka_ops_agent" / "providers" / "terraform_provider.py"
@@ -160,49 +184,51 @@ def validate_terraform_provider():
             print("\n5. Testing Terraform configuration generation...")
             
             # Test configuration generation for AWS
-            provider._generate_terraform_config(instance_id, cluster_config, instance_dir)
+            files = provider._generate_terraform_config(instance_id, cluster_config, instance_dir)
             
-            # Check that all required files are created
+            # Check that all required files are created (one directory scan)
             required_files = [
                 "main.tf", "variables.tf", "outputs.tf", 
                 "provider.tf", "resources.tf", "terraform.tfvars"
             ]
             
+            with os.scandir(instance_dir) as entries:
+                written_files = {entry.name for entry in entries}
+            
             for file_name in required_files:
-                file_path = instance_dir / file_name
-                assert file_path.exists(), f"Missing file: {file_name}"
+                assert file_name in written_files, f"Missing file: {file_name}"
                 print(f"   ✅ Generated {file_name}")
             
             print("\n6. Validating configuration content...")
             
             # Check main.tf
-            main_content = (instance_dir / "main.tf").read_text()
+            main_content = files["main.tf"]
             assert instance_id in main_content
             assert "terraform" in main_content
             assert "required_providers" in main_content
             print("   ✅ main.tf content validated")
             
             # Check variables.tf
-            variables_content = (instance_dir / "variables.tf").read_text()
+            variables_content = files["variables.tf"]
             assert "cluster_size" in variables_content
             assert "instance_type" in variables_content
             assert "enable_ssl" in variables_content
             print("   ✅ variables.tf content validated")
             
             # Check outputs.tf
-            outputs_content = (instance_dir / "outputs.tf").read_text()
+            outputs_content = files["outputs.tf"]
             assert "bootstrap_servers" in outputs_content
             assert "zookeeper_connect" in outputs_content
             print("   ✅ outputs.tf content validated")
             
             # Check provider.tf (AWS)
-            provider_content = (instance_dir / "provider.tf").read_text()
+            provider_content = files["provider.tf"]
             assert "aws" in provider_content
             assert "aws_region" in provider_content
             print("   ✅ provider.tf content validated")
             
             # Check resources.tf (AWS)
-            resources_content = (instance_dir / "resources.tf").read_text()
+            resources_content = files["resources.tf"]
             assert "aws_instance" in resources_content
             assert "aws_vpc" in resources_content
             assert "kafka" in resources_content.lower()
@@ -210,7 +236,7 @@ def validate_terraform_provider():
             print("   ✅ resources.tf content validated")
             
             # Check terraform.tfvars
-            tfvars_content = (instance_dir / "terraform.tfvars").read_text()
+            tfvars_content = files["terraform.tfvars"]
             assert f'cluster_name = "{instance_id}"' in tfvars_content
             assert 'cluster_size = 3' in tfvars_content
             assert 'enable_ssl = true' in tfvars_content
@@ -249,12 +275,12 @@ def validate_terraform_provider():
             )
             
             gcp_instance_dir = gcp_provider._create_instance_directory("test-gcp-cluster")
-            gcp_provider._generate_terraform_config("test-gcp-cluster", cluster_config, gcp_instance_dir)
+            gcp_files = gcp_provider._generate_terraform_config("test-gcp-cluster", cluster_config, gcp_instance_dir)
             
-            gcp_provider_content = (gcp_instance_dir / "provider.tf").read_text()
+            gcp_provider_content = gcp_files["provider.tf"]
             assert "google" in gcp_provider_content
             
-            gcp_resources_content = (gcp_instance_dir / "resources.tf").read_text()
+            gcp_resources_content = gcp_files["resources.tf"]
             assert "google_compute_instance" in gcp_resources_content
             print("   ✅ GCP configuration generated")
             
@@ -265,12 +291,12 @@ def validate_terraform_provider():
             )
             
             azure_instance_dir = azure_provider._create_instance_directory("test-azure-cluster")
-            azure_provider._generate_terraform_config("test-azure-cluster", cluster_config, azure_instance_dir)
+            azure_files = azure_provider._generate_terraform_config("test-azure-cluster", cluster_config, azure_instance_dir)
             
-            azure_provider_content = (azure_instance_dir / "provider.tf").read_text()
+            azure_provider_content = azure_files["provider.tf"]
             assert "azurerm" in azure_provider_content
             
-            azure_resources_content = (azure_instance_dir / "resources.tf").read_text()
+            azure_resources_content = azure_files["resources.tf"]
             assert "azurerm_linux_virtual_machine" in azure_resources_content
             print("   ✅ Azure configuration generated")
             
@@ -285,9 +311,9 @@ def validate_terraform_provider():
                 size_cluster_config = provider._parse_config(size_config)
                 size_instance_dir = provider._create_instance_directory(f"test-size-{size}-cluster")
                 
-                provider._generate_terraform_config(f"test-size-{size}-cluster", size_cluster_config, size_instance_dir)
+                size_files = provider._generate_terraform_config(f"test-size-{size}-cluster", size_cluster_config, size_instance_dir)
                 
-                size_tfvars = (size_instance_dir / "terraform.tfvars").read_text()
+                size_tfvars = size_files["terraform.tfvars"]
                 assert f'cluster_size = {size}' in size_tfvars
                 print(f"   ✅ Cluster size {size} configuration validated")
         
@@ -326,27 +352,8 @@ def show_sample_terraform_files():
         cluster_path = project_root / "kafka_ops_agent" / "models" / "cluster.py"
         cluster_module = load_module_from_file("cluster", cluster_path)
         
-        # Mock subprocess and shutil
-        import types
-        mock_subprocess = types.ModuleType('subprocess')
-        
-        class MockResult:
-            def __init__(self, returncode=0, stdout="", stderr=""):
-                self.returncode = returncode
-                self.stdout = stdout
-                self.stderr = stderr
-        
-        def mock_run(*args, **kwargs):
-            if "version" in str(args):
-                return MockResult(0, "Terraform v1.5.0", "")
-            return MockResult(0, "Success", "")
-        
-        mock_subprocess.run = mock_run
-        sys.modules['subprocess'] = mock_subprocess
-        
-        mock_shutil = types.ModuleType('shutil')
-        mock_shutil.rmtree = lambda path: None
-        sys.modules['shutil'] = mock_shutil
+        # Mock subprocess and shutil (no-op if already installed above)
+        install_mocks()
         
         terraform_path = project_root / "kafka_ops_agent" / "providers" / "terraform_provider.py"
         terraform_module = load_module_from_file("terraform_provider", terraform_path)
@@ -377,7 +384,7 @@ def show_sample_terraform_files():
             }
             
             cluster_config = provider._parse_config(sample_config)
-            provider._generate_terraform_config(instance_id, cluster_config, instance_dir)
+            files = provider._generate_terraform_config(instance_id, cluster_config, instance_dir)
             
             print("Generated Terraform files:")
             print("-" * 30)
@@ -385,11 +392,10 @@ def show_sample_terraform_files():
             files_to_show = ["main.tf", "terraform.tfvars"]
             
             for file_name in files_to_show:
-                file_path = instance_dir / file_name
-                if file_path.exists():
+                if file_name in files:
                     print(f"\n# {file_name}")
                     print("---")
-                    content = file_path.read_text()
+                    content = files[file_name]
                     # Show first 15 lines to keep output manageable
                     lines = content.split('\n')[:15]
                     print('\n'.join(lines))
@@ -3,82 +3,154 @@
 import pytest
 import time
 import os
+from operator import attrgetter, itemgetter
 from pathlib import Path
+from typing import Any, Dict
+from kubernetes import watch
 
-from kafka_ops_agent.providers.kubernetes_provider import KubernetesProvider
 from kafka_ops_agent.providers.base import ProvisioningStatus
 
 
+def _cluster_statefulsets(provider, instance_id: str) -> Dict[str, Any]:
+    """List a cluster's StatefulSets once, keyed by their ``app`` label."""
+    statefulsets = provider.apps_v1.list_namespaced_stateful_set(
+        namespace=provider.namespace,
+        label_selector=f"cluster={instance_id}"
+    )
+    return {sts.metadata.labels['app']: sts for sts in statefulsets.items}
+
+
+def _wait_ready(provider, sts_name: str, replicas: int, timeout: int = 180) -> None:
+    """Watch a StatefulSet until it reports at least ``replicas`` ready pods.
+    
+    Raises TimeoutError, with the last ready count seen, if the watch ends first.
+    """
+    ready = 0
+    w = watch.Watch()
+    for event in w.stream(
+        provider.apps_v1.list_namespaced_stateful_set,
+        namespace=provider.namespace,
+        field_selector=f"metadata.name={sts_name}",
+        timeout_seconds=timeout
+    ):
+        # ready_replicas is None, not 0, until the first pod is ready
+        ready = event['object'].status.ready_replicas or 0
+        if ready >= replicas:
+            w.stop()
+            return
+    raise TimeoutError(f"StatefulSet {sts_name} had {ready}/{replicas} ready replicas after {timeout}s")
+
+
+def _wait_gone(provider, instance_id: str, timeout: int = 120) -> bool:
+    """Watch a cluster's StatefulSets until all of them have been deleted.
+    
+    Returns False if the watch times out first.
+    """
+    statefulsets = provider.apps_v1.list_namespaced_stateful_set(
+        namespace=provider.namespace,
+        label_selector=f"cluster={instance_id}"
+    )
+    remaining = {sts.metadata.name for sts in statefulsets.items}
+    if not remaining:
+        return True
+    
+    # Resume from the LIST so deletions in between are not missed
+    w = watch.Watch()
+    for event in w.stream(
+        provider.apps_v1.list_namespaced_stateful_set,
+        namespace=provider.namespace,
+        label_selector=f"cluster={instance_id}",
+        resource_version=statefulsets.metadata.resource_version,
+        timeout_seconds=timeout
+    ):
+        if event['type'] == 'DELETED':
+            remaining.discard(event['object'].metadata.name)
+            if not remaining:
+                w.stop()
+                return True
+    return False
+
+
+@pytest.fixture(scope="module")
+def cluster_config():
+    """Sample cluster configuration for integration tests."""
+    return {
+        'cluster_size': 1,  # Single node for faster testing
+        'replication_factor': 1,
+        'partition_count': 3,
+        'retention_hours': 1,  # Short retention for testing
+        'storage_size_gb': 1,  # Minimal storage
+        'enable_ssl': False,
+        'enable_sasl': False,
+        'custom_properties': {
+            'log.segment.bytes': '104857600'  # 100MB segments
+        }
+    }
+
+
+@pytest.fixture(scope="class")
+def provisioned_cluster(kubernetes_provider, cluster_config):
+    """Provision one cluster for the class's read-only tests and yield its instance id."""
+    instance_id = "test-shared-cluster"
+    
+    try:
+        result = kubernetes_provider.provision_cluster(instance_id, cluster_config)
+        assert result.status == ProvisioningStatus.SUCCEEDED
+        yield instance_id
+    finally:
+        kubernetes_provider.deprovision_cluster(instance_id)
+
+
+@pytest.fixture(scope="class")
+def cluster_statefulsets(kubernetes_provider, provisioned_cluster):
+    """The shared cluster's StatefulSets, keyed by component."""
+    return _cluster_statefulsets(kubernetes_provider, provisioned_cluster)
+
+
 @pytest.mark.integration
 @pytest.mark.kubernetes
+@pytest.mark.requires_kubernetes
+@pytest.mark.usefixtures("warm_kafka_images")
 class TestKubernetesIntegration:
     """Integration tests for KubernetesProvider with local cluster."""
     
-    @pytest.fixture(scope="class")
-    def provider(self):
-        """Create KubernetesProvider for integration tests."""
-        # Skip if no Kubernetes cluster available
-        try:
-            provider = KubernetesProvider(namespace="kafka-integration-test")
-            # Test basic connectivity
-            provider.core_v1.list_namespace()
-            return provider
-        except Exception as e:
-            pytest.skip(f"Kubernetes cluster not available: {e}")
-    
-    @pytest.fixture
-    def cluster_config(self):
-        """Sample cluster configuration for integration tests."""
-        return {
-            'cluster_size': 1,  # Single node for faster testing
-            'replication_factor': 1,
-            'partition_count': 3,
-            'retention_hours': 1,  # Short retention for testing
-            'storage_size_gb': 1,  # Minimal storage
-            'enable_ssl': False,
-            'enable_sasl': False,
-            'custom_properties': {
-                'log.segment.bytes': '104857600'  # 100MB segments
-            }
-        }
-    
-    def test_provision_and_deprovision_cluster(self, provider, cluster_config):
+    def test_provision_and_deprovision_cluster(self, isolated_kubernetes_provider, cluster_config):
         """Test full cluster lifecycle - provision and deprovision."""
         instance_id = "test-integration-cluster"
         
         try:
             # Provision cluster
-            result = provider.provision_cluster(instance_id, cluster_config)
+            result = isolated_kubernetes_provider.provision_cluster(instance_id, cluster_config)
             
             assert result.status == ProvisioningStatus.SUCCEEDED
             assert result.instance_id == instance_id
             assert result.connection_info is not None
             
             # Verify cluster is running
-            status = provider.get_cluster_status(instance_id)
+            status = isolated_kubernetes_provider.get_cluster_status(instance_id)
             assert status == ProvisioningStatus.SUCCEEDED
             
             # Verify health check
-            is_healthy = provider.health_check(instance_id)
+            is_healthy = isolated_kubernetes_provider.health_check(instance_id)
             assert is_healthy is True
             
             # Get connection info
-            connection_info = provider.get_connection_info(instance_id)
+            connection_info = isolated_kubernetes_provider.get_connection_info(instance_id)
             assert connection_info is not None
             assert "bootstrap_servers" in connection_info
             assert "zookeeper_connect" in connection_info
             
         finally:
             # Always cleanup
-            deprovision_result = provider.deprovision_cluster(instance_id)
+            deprovision_result = isolated_kubernetes_provider.deprovision_cluster(instance_id)
             assert deprovision_result.status == ProvisioningStatus.SUCCEEDED
             
             # Verify cleanup
-            time.sleep(10)  # Wait for cleanup to complete
-            status = provider.get_cluster_status(instance_id)
+            assert _wait_gone(isolated_kubernetes_provider, instance_id)
+            status = isolated_kubernetes_provider.get_cluster_status(instance_id)
             assert status == ProvisioningStatus.FAILED  # No resources found
     
-    def test_multi_broker_cluster(self, provider, cluster_config):
+    def test_multi_broker_cluster(self, isolated_kubernetes_provider, cluster_config):
         """Test provisioning a multi-broker cluster."""
         instance_id = "test-multi-broker-cluster"
         
@@ -89,32 +161,27 @@ class TestKubernetesIntegration:
             'replication_factor': 2
         })
         
-        try:
-            # Provision cluster
-            result = provider.provision_cluster(instance_id, multi_broker_config)
-            
-            assert result.status == ProvisioningStatus.SUCCEEDED
-            assert result.instance_id == instance_id
-            
-            # Wait a bit longer for multi-broker cluster
-            time.sleep(30)
-            
-            # Verify all brokers are ready
-            status = provider.get_cluster_status(instance_id)
-            assert status == ProvisioningStatus.SUCCEEDED
-            
-            # Verify StatefulSet has correct replica count
-            statefulsets = provider._get_cluster_statefulsets(instance_id)
-            kafka_sts = next((sts for sts in statefulsets if "kafka" in sts.metadata.name), None)
-            assert kafka_sts is not None
-            assert kafka_sts.spec.replicas == 3
-            assert kafka_sts.status.ready_replicas == 3
-            
-        finally:
-            # Cleanup
-            provider.deprovision_cluster(instance_id)
+        # Provision cluster
+        result = isolated_kubernetes_provider.provision_cluster(instance_id, multi_broker_config)
+        
+        assert result.status == ProvisioningStatus.SUCCEEDED
+        assert result.instance_id == instance_id
+        
+        # Wait for every broker to report ready
+        _wait_ready(isolated_kubernetes_provider, f"{instance_id}-kafka", 3)
+        
+        # Verify all brokers are ready
+        status = isolated_kubernetes_provider.get_cluster_status(instance_id)
+        assert status == ProvisioningStatus.SUCCEEDED
+        
+        # Verify StatefulSet has correct replica count
+        statefulsets = _cluster_statefulsets(isolated_kubernetes_provider, instance_id)
+        kafka_sts = statefulsets.get("kafka")
+        assert kafka_sts is not None
+        assert kafka_sts.spec.replicas == 3
+        assert kafka_sts.status.ready_replicas == 3
     
-    def test_cluster_with_custom_properties(self, provider, cluster_config):
+    def test_cluster_with_custom_properties(self, isolated_kubernetes_provider, cluster_config):
         """Test cluster with custom Kafka properties."""
         instance_id = "test-custom-props-cluster"
         
@@ -127,263 +194,129 @@ class TestKubernetesIntegration:
             'num.io.threads': '8'
         }
         
-        try:
-            # Provision cluster
-            result = provider.provision_cluster(instance_id, custom_config)
-            
-            assert result.status == ProvisioningStatus.SUCCEEDED
-            
-            # Verify custom properties are applied
-            statefulsets = provider._get_cluster_statefulsets(instance_id)
-            kafka_sts = next((sts for sts in statefulsets if "kafka" in sts.metadata.name), None)
-            assert kafka_sts is not None
-            
-            # Check environment variables in container spec
-            container = kafka_sts.spec.template.spec.containers[0]
-            env_vars = {env.name: env.value for env in container.env if hasattr(env, 'value')}
-            
-            assert env_vars.get('KAFKA_LOG_RETENTION_BYTES') == '1073741824'
-            assert env_vars.get('KAFKA_LOG_SEGMENT_BYTES') == '268435456'
-            assert env_vars.get('KAFKA_NUM_NETWORK_THREADS') == '8'
-            assert env_vars.get('KAFKA_NUM_IO_THREADS') == '8'
-            
-        finally:
-            # Cleanup
-            provider.deprovision_cluster(instance_id)
+        # Provision cluster
+        result = isolated_kubernetes_provider.provision_cluster(instance_id, custom_config)
+        
+        assert result.status == ProvisioningStatus.SUCCEEDED
+        
+        # Verify custom properties are applied
+        statefulsets = _cluster_statefulsets(isolated_kubernetes_provider, instance_id)
+        kafka_sts = statefulsets.get("kafka")
+        assert kafka_sts is not None
+        
+        # Check environment variables in container spec
+        container = kafka_sts.spec.template.spec.containers[0]
+        # valueFrom entries (e.g. KAFKA_BROKER_ID) have no literal value
+        env_vars = {env.name: env.value for env in container.env if env.value is not None}
+        
+        assert itemgetter(
+            'KAFKA_LOG_RETENTION_BYTES',
+            'KAFKA_LOG_SEGMENT_BYTES',
+            'KAFKA_NUM_NETWORK_THREADS',
+            'KAFKA_NUM_IO_THREADS'
+        )(env_vars) == ('1073741824', '268435456', '8', '8')
     
-    def test_cluster_persistence(self, provider, cluster_config):
+    def test_cluster_persistence(self, kubernetes_provider, cluster_config, provisioned_cluster):
         """Test that cluster data persists with PVCs."""
-        instance_id = "test-persistence-cluster"
-        
-        try:
-            # Provision cluster
-            result = provider.provision_cluster(instance_id, cluster_config)
-            assert result.status == ProvisioningStatus.SUCCEEDED
-            
-            # Verify PVCs are created
-            pvcs = provider.core_v1.list_namespaced_persistent_volume_claim(
-                namespace=provider.namespace,
-                label_selector=f"cluster={instance_id}"
+        # Should have PVCs for Kafka and Zookeeper, selected by component label
+        for app in ("kafka", "zookeeper"):
+            pvcs = kubernetes_provider.core_v1.list_namespaced_persistent_volume_claim(
+                namespace=kubernetes_provider.namespace,
+                label_selector=f"cluster={provisioned_cluster},app={app}"
             )
-            
-            # Should have PVCs for Kafka and Zookeeper
-            pvc_names = [pvc.metadata.name for pvc in pvcs.items]
-            kafka_pvcs = [name for name in pvc_names if "kafka-data" in name]
-            zk_pvcs = [name for name in pvc_names if "zk-data" in name]
-            
-            assert len(kafka_pvcs) >= 1  # At least one Kafka PVC
-            assert len(zk_pvcs) >= 1     # At least one ZK PVC
+            assert len(pvcs.items) >= 1, f"No {app} PVCs"
             
             # Verify PVC sizes
             for pvc in pvcs.items:
                 storage_request = pvc.spec.resources.requests.get('storage')
                 assert storage_request == f"{cluster_config['storage_size_gb']}Gi"
-            
-        finally:
-            # Cleanup
-            provider.deprovision_cluster(instance_id)
     
-    def test_cluster_networking(self, provider, cluster_config):
+    def test_cluster_networking(self, kubernetes_provider, provisioned_cluster):
         """Test cluster networking and service discovery."""
-        instance_id = "test-networking-cluster"
+        instance_id = provisioned_cluster
         
-        try:
-            # Provision cluster
-            result = provider.provision_cluster(instance_id, cluster_config)
-            assert result.status == ProvisioningStatus.SUCCEEDED
-            
-            # Verify services are created
-            services = provider._get_cluster_services(instance_id)
-            service_names = [svc.metadata.name for svc in services]
-            
-            assert f"{instance_id}-kafka" in service_names
-            assert f"{instance_id}-zookeeper" in service_names
-            
-            # Verify Kafka service configuration
-            kafka_service = provider._get_kafka_service(instance_id)
-            assert kafka_service is not None
-            assert kafka_service.spec.type == "ClusterIP"  # Default type
-            
-            # Verify port configuration
-            kafka_port = next((port for port in kafka_service.spec.ports if port.name == "kafka"), None)
-            assert kafka_port is not None
-            assert kafka_port.port == 9092
-            assert kafka_port.target_port == 9092
-            
-            # Verify Zookeeper service
-            zk_service = provider._get_zookeeper_service(instance_id)
-            assert zk_service is not None
-            
-            zk_client_port = next((port for port in zk_service.spec.ports if port.name == "client"), None)
-            assert zk_client_port is not None
-            assert zk_client_port.port == 2181
-            
-        finally:
-            # Cleanup
-            provider.deprovision_cluster(instance_id)
+        # Verify services are created
+        services = kubernetes_provider._get_cluster_services(instance_id)
+        service_names = [svc.metadata.name for svc in services]
+        
+        assert f"{instance_id}-kafka" in service_names
+        assert f"{instance_id}-zookeeper" in service_names
+        
+        # Verify Kafka service configuration
+        kafka_service = kubernetes_provider._get_kafka_service(instance_id)
+        assert kafka_service is not None
+        assert kafka_service.spec.type == "ClusterIP"  # Default type
+        
+        # Verify port configuration
+        kafka_port = next((port for port in kafka_service.spec.ports if port.name == "kafka"), None)
+        assert kafka_port is not None
+        assert kafka_port.port == 9092
+        assert kafka_port.target_port == 9092
+        
+        # Verify Zookeeper service
+        zk_service = kubernetes_provider._get_zookeeper_service(instance_id)
+        assert zk_service is not None
+        
+        zk_client_port = next((port for port in zk_service.spec.ports if port.name == "client"), None)
+        assert zk_client_port is not None
+        assert zk_client_port.port == 2181
     
-    def test_cluster_resource_limits(self, provider, cluster_config):
+    @pytest.mark.parametrize("component,kind,resource,expected", [
+        ("kafka", "requests", "memory", "1Gi"),
+        ("kafka", "requests", "cpu", "500m"),
+        ("kafka", "limits", "memory", "2Gi"),
+        ("kafka", "limits", "cpu", "1000m"),
+        ("zookeeper", "requests", "memory", "512Mi"),
+        ("zookeeper", "requests", "cpu", "250m"),
+        ("zookeeper", "limits", "memory", "1Gi"),
+        ("zookeeper", "limits", "cpu", "500m"),
+    ])
+    def test_cluster_resource_limits(self, cluster_statefulsets, component, kind, resource, expected):
         """Test that resource limits are properly set."""
-        instance_id = "test-resources-cluster"
+        container = cluster_statefulsets[component].spec.template.spec.containers[0]
         
-        try:
-            # Provision cluster
-            result = provider.provision_cluster(instance_id, cluster_config)
-            assert result.status == ProvisioningStatus.SUCCEEDED
-            
-            # Check Kafka StatefulSet resources
-            statefulsets = provider._get_cluster_statefulsets(instance_id)
-            kafka_sts = next((sts for sts in statefulsets if "kafka" in sts.metadata.name), None)
-            assert kafka_sts is not None
-            
-            kafka_container = kafka_sts.spec.template.spec.containers[0]
-            resources = kafka_container.resources
-            
-            # Verify resource requests and limits are set
-            assert resources.requests is not None
-            assert resources.limits is not None
-            
-            assert resources.requests['memory'] == '1Gi'
-            assert resources.requests['cpu'] == '500m'
-            assert resources.limits['memory'] == '2Gi'
-            assert resources.limits['cpu'] == '1000m'
-            
-            # Check Zookeeper StatefulSet resources
-            zk_sts = next((sts for sts in statefulsets if "zookeeper" in sts.metadata.name), None)
-            assert zk_sts is not None
-            
-            zk_container = zk_sts.spec.template.spec.containers[0]
-            zk_resources = zk_container.resources
-            
-            assert zk_resources.requests['memory'] == '512Mi'
-            assert zk_resources.requests['cpu'] == '250m'
-            assert zk_resources.limits['memory'] == '1Gi'
-            assert zk_resources.limits['cpu'] == '500m'
-            
-        finally:
-            # Cleanup
-            provider.deprovision_cluster(instance_id)
+        assert getattr(container.resources, kind)[resource] == expected
     
-    def test_cluster_health_probes(self, provider, cluster_config):
+    @pytest.mark.parametrize("component,field,expected", [
+        ("kafka", "startup_probe.tcp_socket.port", 9092),
+        ("kafka", "startup_probe.period_seconds", 2),
+        ("kafka", "startup_probe.failure_threshold", 60),
+        ("kafka", "readiness_probe.tcp_socket.port", 9092),
+        ("kafka", "readiness_probe.initial_delay_seconds", 0),
+        ("kafka", "liveness_probe.tcp_socket.port", 9092),
+        ("kafka", "liveness_probe.initial_delay_seconds", 0),
+        ("zookeeper", "readiness_probe.tcp_socket.port", 2181),
+        ("zookeeper", "liveness_probe.tcp_socket.port", 2181),
+    ])
+    def test_cluster_health_probes(self, cluster_statefulsets, component, field, expected):
         """Test that health probes are configured correctly."""
-        instance_id = "test-probes-cluster"
+        container = cluster_statefulsets[component].spec.template.spec.containers[0]
         
-        try:
-            # Provision cluster
-            result = provider.provision_cluster(instance_id, cluster_config)
-            assert result.status == ProvisioningStatus.SUCCEEDED
-            
-            # Check Kafka container probes
-            statefulsets = provider._get_cluster_statefulsets(instance_id)
-            kafka_sts = next((sts for sts in statefulsets if "kafka" in sts.metadata.name), None)
-            kafka_container = kafka_sts.spec.template.spec.containers[0]
-            
-            # Verify readiness probe
-            assert kafka_container.readiness_probe is not None
-            assert kafka_container.readiness_probe.tcp_socket.port == 9092
-            assert kafka_container.readiness_probe.initial_delay_seconds == 30
-            
-            # Verify liveness probe
-            assert kafka_container.liveness_probe is not None
-            assert kafka_container.liveness_probe.tcp_socket.port == 9092
-            assert kafka_container.liveness_probe.initial_delay_seconds == 60
-            
-            # Check Zookeeper container probes
-            zk_sts = next((sts for sts in statefulsets if "zookeeper" in sts.metadata.name), None)
-            zk_container = zk_sts.spec.template.spec.containers[0]
-            
-            assert zk_container.readiness_probe is not None
-            assert zk_container.readiness_probe.tcp_socket.port == 2181
-            assert zk_container.liveness_probe is not None
-            assert zk_container.liveness_probe.tcp_socket.port == 2181
-            
-        finally:
-            # Cleanup
-            provider.deprovision_cluster(instance_id)
+        assert attrgetter(field)(container) == expected
     
     @pytest.mark.slow
-    def test_cluster_startup_time(self, provider, cluster_config):
+    def test_cluster_startup_time(self, isolated_kubernetes_provider, cluster_config):
         """Test cluster startup time and readiness."""
         instance_id = "test-startup-time-cluster"
         
-        try:
-            start_time = time.time()
-            
-            # Provision cluster
-            result = provider.provision_cluster(instance_id, cluster_config)
-            
-            provision_time = time.time() - start_time
-            
-            assert result.status == ProvisioningStatus.SUCCEEDED
-            
-            # Log startup time for monitoring
-            print(f"Cluster startup time: {provision_time:.2f} seconds")
-            
-            # Verify cluster is actually ready for connections
-            connection_info = provider.get_connection_info(instance_id)
-            assert connection_info is not None
-            
-            # Basic connectivity test could be added here
-            # (would require Kafka client libraries)
-            
-        finally:
-            # Cleanup
-            provider.deprovision_cluster(instance_id)
-
-
-@pytest.mark.integration
-@pytest.mark.kubernetes
-class TestKubernetesProviderErrorHandling:
-    """Test error handling scenarios for Kubernetes provider."""
-    
-    @pytest.fixture
-    def provider(self):
-        """Create KubernetesProvider for error testing."""
-        try:
-            return KubernetesProvider(namespace="kafka-error-test")
-        except Exception as e:
-            pytest.skip(f"Kubernetes cluster not available: {e}")
-    
-    def test_provision_invalid_config(self, provider):
-        """Test provisioning with invalid configuration."""
-        invalid_config = {
-            'cluster_size': -1,  # Invalid
-            'replication_factor': 0,  # Invalid
-            'storage_size_gb': 0  # Invalid
-        }
+        start_time = time.time()
         
-        # Should handle gracefully and return failure
-        result = provider.provision_cluster("invalid-cluster", invalid_config)
+        # Provision cluster
+        result = isolated_kubernetes_provider.provision_cluster(instance_id, cluster_config)
         
-        # The provider should handle this gracefully
-        # (actual behavior depends on Kubernetes validation)
-        assert result.instance_id == "invalid-cluster"
-    
-    def test_deprovision_nonexistent_cluster(self, provider):
-        """Test deprovisioning a cluster that doesn't exist."""
-        result = provider.deprovision_cluster("nonexistent-cluster")
+        provision_time = time.time() - start_time
         
-        # Should succeed (idempotent operation)
         assert result.status == ProvisioningStatus.SUCCEEDED
-        assert result.instance_id == "nonexistent-cluster"
-    
-    def test_get_status_nonexistent_cluster(self, provider):
-        """Test getting status of nonexistent cluster."""
-        status = provider.get_cluster_status("nonexistent-cluster")
         
-        assert status == ProvisioningStatus.FAILED
-    
-    def test_health_check_nonexistent_cluster(self, provider):
-        """Test health check of nonexistent cluster."""
-        is_healthy = provider.health_check("nonexistent-cluster")
+        # Log startup time for monitoring
+        print(f"Cluster startup time: {provision_time:.2f} seconds")
         
-        assert is_healthy is False
-    
-    def test_connection_info_nonexistent_cluster(self, provider):
-        """Test getting connection info for nonexistent cluster."""
-        connection_info = provider.get_connection_info("nonexistent-cluster")
+        # Verify cluster is actually ready for connections
+        connection_info = isolated_kubernetes_provider.get_connection_info(instance_id)
+        assert connection_info is not None
         
-        assert connection_info is None
+        # Basic connectivity test could be added here
+        # (would require Kafka client libraries)
 
 
 if __name__ == "__main__":
@@ -34,6 +34,7 @@ class TestKubernetesProvider:
                 'apps_v1': mock_apps_v1,
                 'core_v1': mock_core_v1,
                 'storage_v1': mock_storage_v1,
+                'client': mock_client,
                 'config': mock_config
             }
     
@@ -89,6 +90,18 @@ class TestKubernetesProvider:
         mock_k8s_clients['config'].load_incluster_config.assert_called_once()
         mock_k8s_clients['config'].load_kube_config.assert_called_once()
     
+    def test_init_with_api_client(self, mock_k8s_clients):
+        """Test initialization with a shared ApiClient."""
+        api_client = Mock()
+        
+        provider = KubernetesProvider(namespace="test-namespace", api_client=api_client)
+        
+        mock_k8s_clients['config'].load_incluster_config.assert_not_called()
+        mock_k8s_clients['config'].load_kube_config.assert_not_called()
+        mock_k8s_clients['client'].AppsV1Api.assert_called_once_with(api_client)
+        mock_k8s_clients['client'].CoreV1Api.assert_called_once_with(api_client)
+        assert provider.core_v1 == mock_k8s_clients['core_v1']
+    
     def test_ensure_namespace_exists(self, provider, mock_k8s_clients):
         """Test namespace creation when it doesn't exist."""
         mock_k8s_clients['core_v1'].read_namespace.side_effect = ApiException(status=404)
@@ -154,6 +167,17 @@ class TestKubernetesProvider:
         assert env_vars["KAFKA_LOG_RETENTION_HOURS"] == "168"
         assert env_vars["KAFKA_NUM_PARTITIONS"] == "6"
         assert env_vars["KAFKA_LOG_SEGMENT_BYTES"] == "1073741824"
+        
+        # Check PVCs carry the labels used to select them
+        pvc_labels = statefulset["spec"]["volumeClaimTemplates"][0]["metadata"]["labels"]
+        assert pvc_labels == {"app": "kafka", "cluster": "test-cluster"}
+        
+        # Check probes: startup probe gates readiness and liveness
+        assert container["startupProbe"]["tcpSocket"]["port"] == 9092
+        assert container["startupProbe"]["periodSeconds"] == 2
+        assert container["startupProbe"]["failureThreshold"] == 60
+        assert container["readinessProbe"]["initialDelaySeconds"] == 0
+        assert container["livenessProbe"]["initialDelaySeconds"] == 0
     
     def test_apply_manifests_success(self, provider, mock_k8s_clients):
         """Test successful manifest application."""
@@ -369,6 +393,23 @@ class TestKubernetesProvider:
         mock_k8s_clients['core_v1'].delete_namespaced_service.assert_called_once()
         mock_k8s_clients['core_v1'].delete_namespaced_persistent_volume_claim.assert_called_once()
     
+    def test_cleanup_cluster_background_propagation(self, provider, mock_k8s_clients):
+        """Test cluster cleanup deletes with background propagation."""
+        mock_sts = Mock()
+        mock_sts.metadata.name = "test-cluster-kafka"
+        mock_k8s_clients['apps_v1'].list_namespaced_stateful_set.return_value.items = [mock_sts]
+        mock_k8s_clients['core_v1'].list_namespaced_service.return_value.items = []
+        mock_k8s_clients['core_v1'].list_namespaced_persistent_volume_claim.return_value.items = []
+        
+        provider._cleanup_cluster("test-cluster")
+        
+        mock_k8s_clients['client'].V1DeleteOptions.assert_called_once_with(propagation_policy="Background")
+        mock_k8s_clients['apps_v1'].delete_namespaced_stateful_set.assert_called_once_with(
+            name="test-cluster-kafka",
+            namespace="test-namespace",
+            body=mock_k8s_clients['client'].V1DeleteOptions.return_value
+        )
+    
     def test_cleanup_cluster_resource_not_found(self, provider, mock_k8s_clients):
         """Test cluster cleanup when resources don't exist."""
         # Mock StatefulSets
@@ -402,6 +443,29 @@ class TestKubernetesProvider:
         assert connection_info is not None
         assert connection_info.bootstrap_servers == ["10.0.0.1:9092"]
     
+    def test_wait_for_cluster_ready_waits_for_change(self, provider, mock_k8s_clients):
+        """Test waiting for cluster to be ready rechecks after a StatefulSet change."""
+        cluster_config = ClusterConfig(cluster_size=1, replication_factor=1, partition_count=3, 
+                                     retention_hours=168, storage_size_gb=10, enable_ssl=False, 
+                                     enable_sasl=False, custom_properties={})
+        
+        with patch.object(provider, 'get_cluster_status') as mock_status, \
+             patch.object(provider, 'get_connection_info') as mock_conn_info, \
+             patch.object(provider, '_wait_for_statefulset_change') as mock_wait_change, \
+             patch('kafka_ops_agent.providers.kubernetes_provider.time.sleep') as mock_sleep:
+            
+            mock_status.side_effect = [ProvisioningStatus.IN_PROGRESS, ProvisioningStatus.SUCCEEDED]
+            mock_conn_info.return_value = {
+                "bootstrap_servers": ["10.0.0.1:9092"],
+                "zookeeper_connect": "test-zk:2181"
+            }
+            
+            connection_info = provider._wait_for_cluster_ready("test-cluster", cluster_config, timeout=30)
+        
+        assert connection_info.bootstrap_servers == ["10.0.0.1:9092"]
+        mock_wait_change.assert_called_once_with("test-cluster", 15)
+        mock_sleep.assert_not_called()
+    
     def test_wait_for_cluster_ready_timeout(self, provider, mock_k8s_clients):
         """Test waiting for cluster to be ready - timeout case."""
         cluster_config = ClusterConfig(cluster_size=1, replication_factor=1, partition_count=3, 
@@ -415,5 +479,67 @@ class TestKubernetesProvider:
                 provider._wait_for_cluster_ready("test-cluster", cluster_config, timeout=1)
 
 
+class TestKubernetesProviderErrorHandling:
+    """Test error handling scenarios for Kubernetes provider."""
+    
+    @pytest.fixture
+    def provider(self):
+        """KubernetesProvider whose API clients find no cluster resources."""
+        provider = KubernetesProvider.__new__(KubernetesProvider)
+        provider.namespace = "test-namespace"
+        provider.kubeconfig_path = None
+        provider.apps_v1 = MagicMock()
+        provider.core_v1 = MagicMock()
+        provider.storage_v1 = MagicMock()
+        
+        provider.apps_v1.list_namespaced_stateful_set.return_value.items = []
+        provider.core_v1.list_namespaced_service.return_value.items = []
+        provider.core_v1.list_namespaced_persistent_volume_claim.return_value.items = []
+        provider.core_v1.read_namespaced_service.side_effect = ApiException(status=404)
+        return provider
+    
+    def test_provision_invalid_config(self, provider):
+        """Test provisioning with invalid configuration."""
+        invalid_config = {
+            'cluster_size': -1,  # Invalid
+            'replication_factor': 0,  # Invalid
+            'storage_size_gb': 0  # Invalid
+        }
+        
+        # Should handle gracefully and return failure
+        result = provider.provision_cluster("invalid-cluster", invalid_config)
+        
+        assert result.status == ProvisioningStatus.FAILED
+        assert result.instance_id == "invalid-cluster"
+        provider.apps_v1.create_namespaced_stateful_set.assert_not_called()
+    
+    def test_deprovision_nonexistent_cluster(self, provider):
+        """Test deprovisioning a cluster that doesn't exist."""
+        result = provider.deprovision_cluster("nonexistent-cluster")
+        
+        # Should succeed (idempotent operation)
+        assert result.status == ProvisioningStatus.SUCCEEDED
+        assert result.instance_id == "nonexistent-cluster"
+        provider.apps_v1.delete_namespaced_stateful_set.assert_not_called()
+    
+    def test_get_status_nonexistent_cluster(self, provider):
+        """Test getting status of nonexistent cluster."""
+        status = provider.get_cluster_status("nonexistent-cluster")
+        
+        assert status == ProvisioningStatus.FAILED
+    
+    def test_health_check_nonexistent_cluster(self, provider):
+        """Test health check of nonexistent cluster."""
+        is_healthy = provider.health_check("nonexistent-cluster")
+        
+        assert is_healthy is False
+    
+    def test_connection_info_nonexistent_cluster(self, provider):
+        """Test getting connection info for nonexistent cluster."""
+        connection_info = provider.get_connection_info("nonexistent-cluster")
+        
+        assert connection_info is None
+
+
 if __name__ == "__main__":
     pytest.main([__file__])
\ No newline at end of file
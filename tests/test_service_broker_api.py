@@ -261,6 +261,25 @@ class TestServiceBrokerAPI:
         data = json.loads(response.data)
         assert data['state'] == 'failed'
     
+    def test_get_last_operation_long_poll(self, client, mock_provisioning_service):
+        """Test last operation waits for an in-progress operation to finish."""
+        mock_provisioning_service.get_cluster_status.side_effect = [
+            ClusterStatus.CREATING,
+            ClusterStatus.CREATING,
+            ClusterStatus.RUNNING
+        ]
+        
+        with patch('kafka_ops_agent.api.service_broker.LONG_POLL_INTERVAL', 0.01):
+            response = client.get(
+                '/v2/service_instances/test-instance/last_operation?service_id=kafka-service&plan_id=basic&wait=5'
+            )
+        
+        assert response.status_code == 200
+        
+        data = json.loads(response.data)
+        assert data['state'] == 'succeeded'
+        assert mock_provisioning_service.get_cluster_status.call_count == 3
+    
     def test_get_last_operation_not_found(self, client, mock_provisioning_service):
         """Test last operation for non-existent instance."""
         mock_provisioning_service.get_cluster_status.return_value = None
@@ -146,6 +146,23 @@ class TestTerraformProvider:
             assert 'cluster_size = 3' in tfvars_content
             assert 'enable_ssl = true' in tfvars_content
     
+    def test_generate_terraform_config_returns_rendered_files(self, provider, sample_config):
+        """Test that generated file contents are returned alongside being written."""
+        cluster_config = provider._parse_config(sample_config)
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            instance_dir = Path(temp_dir)
+
+            files = provider._generate_terraform_config("test-cluster", cluster_config, instance_dir)
+
+            assert set(files) == {
+                "main.tf", "variables.tf", "outputs.tf",
+                "provider.tf", "resources.tf", "terraform.tfvars"
+            }
+            assert "aws_instance" in files["resources.tf"]
+            for file_name, content in files.items():
+                assert (instance_dir / file_name).read_text() == content
+
     def test_generate_terraform_config_gcp(self, mock_subprocess, sample_config):
         """Test Terraform configuration generation for GCP."""
         provider = TerraformProvider(cloud_provider="gcp")